@@ -7,73 +7,305 @@ Author: Valters Upenieks
 Created for Redis Technical Support Engineer interview
 """
 
+import asyncio
+import gzip
+import io
+import json
+import os
 import redis
+import redis.asyncio as aredis
+import shutil
+import signal
+import socket
 import time
 import sys
-from datetime import datetime
+import unicodedata
+from collections import deque
+from dataclasses import asdict, dataclass
+
+# INFO sections the dashboard reads; skips keyspace, cpu, modules, etc.
+_INFO_SECTIONS = ('server', 'memory', 'stats', 'clients', 'replication', 'persistence')
+
+# Rarely-changing sections are skipped between re-probes every this many
+# refreshes: server always (version, OS; uptime is derived locally) and
+# replication on a standalone master, so a failover or a newly attached
+# replica still shows up
+_TOPOLOGY_RECHECK = 12
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Snapshots kept per host for --dump: one hour at the default 5s interval
+_HISTORY_LEN = 720
+
+# Fixed-layout top of the dashboard; fields are filled from the refresh snapshot
+_DASHBOARD_SPEC = (
+    "=" * 70,
+    "           🔴 REDIS HEALTH MONITOR",
+    "           Built by Valters Upenieks for Redis Interview",
+    "=" * 70,
+    "Timestamp: {timestamp}",
+    "",
+    "📊 SERVER INFORMATION",
+    "   Redis Version: {snap.server.version}",
+    "   OS: {snap.server.os}",
+    "   Uptime: {snap.server.uptime_days} days ({snap.server.uptime_seconds} seconds)",
+    "",
+    "💾 MEMORY USAGE",
+    "   Used Memory: {snap.memory.used_memory_human}",
+    "   Max Memory: {snap.memory.maxmemory_human}",
+    "   Fragmentation Ratio: {snap.memory.fragmentation_ratio}",
+    "   Evicted Keys: {snap.memory.evicted_keys}",
+    "",
+    "⚡ PERFORMANCE STATS",
+    "   Operations/sec: {snap.stats.ops_per_sec}",
+    "   Total Commands: {snap.stats.total_commands:,}",
+    "   Total Connections: {snap.stats.total_connections:,}",
+    "   Cache Hit Rate: {snap.hit_rate}%",
+    "   Rejected Connections: {snap.stats.rejected_connections}",
+    "",
+    "👥 CONNECTED CLIENTS",
+    "   Connected: {snap.clients.connected_clients}",
+    "   Blocked: {snap.clients.blocked_clients}",
+    "   Max Clients: {snap.clients.max_clients}",
+    "",
+)
+
+_DASHBOARD_FOOTER = (
+    "=" * 70,
+    "Press Ctrl+C to exit | Refreshes every 5 seconds",
+    "=" * 70,
+)
+
+def _human(n_bytes):
+    """Format a byte count the way Redis does for *_human INFO fields"""
+    if n_bytes < 1024:
+        return f"{n_bytes}B"
+    for unit in 'KMGTP':
+        n_bytes /= 1024
+        if n_bytes < 1024 or unit == 'P':
+            return f"{n_bytes:.2f}{unit}"
+
+@dataclass(slots=True, frozen=True)
+class ServerInfo:
+    version: str
+    os: str
+    uptime_days: int
+    uptime_seconds: int
+
+@dataclass(slots=True, frozen=True)
+class MemoryInfo:
+    used_memory: int
+    used_memory_human: str
+    maxmemory: int
+    maxmemory_human: str
+    fragmentation_ratio: float
+    evicted_keys: int
+
+@dataclass(slots=True, frozen=True)
+class Stats:
+    total_connections: int
+    total_commands: int
+    ops_per_sec: int
+    rejected_connections: int
+    keyspace_hits: int
+    keyspace_misses: int
+
+@dataclass(slots=True, frozen=True)
+class ClientsInfo:
+    connected_clients: int
+    blocked_clients: int
+    max_clients: int
+
+    @property
+    def usage_percent(self):
+        return (self.connected_clients / self.max_clients) * 100
+
+@dataclass(slots=True, frozen=True)
+class ReplicationInfo:
+    role: str
+    connected_slaves: int = 0
+    master_link_status: str = 'N/A'
+    master_host: str = 'N/A'
+
+@dataclass(slots=True, frozen=True)
+class PersistenceInfo:
+    rdb_enabled: bool
+    rdb_last_save: int
+    aof_enabled: bool
+    aof_rewrite_in_progress: bool
+
+@dataclass(slots=True, frozen=True)
+class Snapshot:
+    """Everything the dashboard and health checks read for one refresh"""
+    server: ServerInfo
+    memory: MemoryInfo
+    stats: Stats
+    hit_rate: float
+    clients: ClientsInfo
+    replication: ReplicationInfo
+    persistence: PersistenceInfo
+    timestamp: float
+
+# Health checks as (predicate, warning template); a template is only formatted
+# when its check fires, so a healthy refresh builds no strings
+_CHECKS = (
+    (lambda s: s.memory.fragmentation_ratio > 1.5,
+     "⚠️  High memory fragmentation: {s.memory.fragmentation_ratio}"),
+    (lambda s: s.memory.evicted_keys > 0,
+     "⚠️  Keys being evicted: {s.memory.evicted_keys}"),
+    (lambda s: s.clients.usage_percent > 80,
+     "⚠️  High client usage: {s.clients.usage_percent:.1f}%"),
+    (lambda s: s.hit_rate < 80 and (s.stats.keyspace_hits + s.stats.keyspace_misses) > 100,
+     "⚠️  Low cache hit rate: {s.hit_rate}%"),
+    (lambda s: s.replication.role == 'slave' and s.replication.master_link_status != 'up',
+     "❌ Replication link DOWN!"),
+)
+
+# Gauges served with --prom-port as (name, help, value from Snapshot)
+_PROM_METRICS = (
+    ('redis_uptime_seconds', 'Server uptime in seconds', lambda s: s.server.uptime_seconds),
+    ('redis_used_memory_bytes', 'Memory used by Redis', lambda s: s.memory.used_memory),
+    ('redis_maxmemory_bytes', 'Configured maxmemory (0 = not set)', lambda s: s.memory.maxmemory),
+    ('redis_mem_fragmentation_ratio', 'Memory fragmentation ratio', lambda s: s.memory.fragmentation_ratio),
+    ('redis_evicted_keys', 'Keys evicted since startup', lambda s: s.memory.evicted_keys),
+    ('redis_ops_per_sec', 'Instantaneous operations per second', lambda s: s.stats.ops_per_sec),
+    ('redis_commands_processed', 'Commands processed since startup', lambda s: s.stats.total_commands),
+    ('redis_connections_received', 'Connections received since startup', lambda s: s.stats.total_connections),
+    ('redis_rejected_connections', 'Connections rejected since startup', lambda s: s.stats.rejected_connections),
+    ('redis_keyspace_hits', 'Keyspace hits since startup', lambda s: s.stats.keyspace_hits),
+    ('redis_keyspace_misses', 'Keyspace misses since startup', lambda s: s.stats.keyspace_misses),
+    ('redis_hit_rate_percent', 'Cache hit rate in percent', lambda s: s.hit_rate),
+    ('redis_connected_clients', 'Connected clients', lambda s: s.clients.connected_clients),
+    ('redis_blocked_clients', 'Clients blocked on a blocking call', lambda s: s.clients.blocked_clients),
+    ('redis_max_clients', 'Configured maxclients', lambda s: s.clients.max_clients),
+    ('redis_connected_slaves', 'Connected replicas (masters only)', lambda s: s.replication.connected_slaves),
+    ('redis_master_link_up', 'Replica link to master is up (replicas only, NaN otherwise)',
+     lambda s: (1 if s.replication.master_link_status == 'up' else 0)
+     if s.replication.role == 'slave' else float('nan')),
+    ('redis_rdb_last_save_timestamp_seconds', 'Unix time of the last RDB save', lambda s: s.persistence.rdb_last_save),
+    ('redis_aof_enabled', 'Whether AOF is enabled', lambda s: 1 if s.persistence.aof_enabled else 0),
+)
 
 class RedisHealthMonitor:
-    def __init__(self, host='localhost', port=6379):
-        """Initialize Redis connection"""
+    def __init__(self, host='localhost', port=6379, exit_on_error=True):
+        """Initialize Redis connection
+
+        With exit_on_error=False a host that cannot be reached is reported
+        and kept; its refreshes fail until it comes up (used by --hosts).
+        """
         try:
-            self.redis = redis.Redis(
-                host=host,
-                port=port,
-                decode_responses=True,
-                socket_connect_timeout=5
-            )
+            # Dedicated pool with TCP keepalive so the long-running loop
+            # keeps reusing one warm connection
+            keepalive_options = {}
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                keepalive_options[socket.TCP_KEEPIDLE] = 30
+            self._connection_kwargs = {
+                'host': host,
+                'port': port,
+                'decode_responses': True,
+                'socket_connect_timeout': 5,
+                'socket_keepalive': True,
+                'socket_keepalive_options': keepalive_options,
+                'max_connections': 4
+            }
+            self.pool = redis.ConnectionPool(**self._connection_kwargs)
+            self.redis = redis.Redis(connection_pool=self.pool)
+            self.address = f"[{host}]:{port}" if ':' in host else f"{host}:{port}"
+            self._frame = []
+            self._lines = []
+            self._history = deque(maxlen=_HISTORY_LEN)
+            self._last_save_str_cache = (0, "")
+            self._refreshes = 0
+            # Filled from the first server section that arrives
+            self._server_static = {'version': 'Unknown', 'os': 'Unknown'}
+            self._boot_time = time.time()
+            self._probe_server = True
+            self._last_connections = 0
+            self._update_topology({})
             # Test connection
             self.redis.ping()
-            print(f"✅ Connected to Redis at {host}:{port}\n")
+            self._cache_server_info(self.redis.info('server'))
+            self._update_topology(self.redis.info('replication'))
+            print(f"✅ Connected to Redis at {self.address}\n")
         except redis.ConnectionError:
-            print(f"❌ Cannot connect to Redis at {host}:{port}")
+            print(f"❌ Cannot connect to Redis at {self.address}")
             print("   Make sure Redis is running: redis-server")
-            sys.exit(1)
+            if exit_on_error:
+                sys.exit(1)
         except Exception as e:
             print(f"❌ Error connecting to Redis: {e}")
-            sys.exit(1)
+            if exit_on_error:
+                sys.exit(1)
 
-    def get_server_info(self):
-        """Get basic server information"""
-        info = self.redis.info('server')
-        return {
+    def close(self):
+        """Close the Redis connection and release the pool"""
+        self.redis.close()
+        self.pool.disconnect()
+
+    def _update_topology(self, info):
+        """Remember the replication role; standalone masters skip the section"""
+        self._role = info.get('role', 'unknown')
+        self._skip_repl = self._role == 'master' and info.get('connected_slaves', 0) == 0
+
+    def _cache_server_info(self, info):
+        """Remember version, OS and boot time from a server section"""
+        self._server_static = {
             'version': info.get('redis_version', 'Unknown'),
-            'os': info.get('os', 'Unknown'),
-            'uptime_days': info.get('uptime_in_days', 0),
-            'uptime_seconds': info.get('uptime_in_seconds', 0)
+            'os': info.get('os', 'Unknown')
         }
+        self._boot_time = time.time() - info.get('uptime_in_seconds', 0)
+        self._probe_server = False
+
+    def get_server_info(self, info=None):
+        """Get basic server information"""
+        if info is None:
+            info = self.redis.info('server')
+        if 'uptime_in_seconds' in info:
+            # Fresh server section; this also picks up restarts and upgrades
+            self._cache_server_info(info)
+            uptime_seconds = info['uptime_in_seconds']
+        else:
+            uptime_seconds = int(time.time() - self._boot_time)
+        return ServerInfo(
+            version=self._server_static['version'],
+            os=self._server_static['os'],
+            uptime_days=uptime_seconds // 86400,
+            uptime_seconds=uptime_seconds
+        )
 
-    def get_memory_info(self):
+    def get_memory_info(self, info=None):
         """Get memory statistics"""
-        info = self.redis.info('memory')
-        used_memory_mb = info.get('used_memory', 0) / (1024 * 1024)
+        if info is None:
+            info = self.redis.info('memory')
+        used_memory = info.get('used_memory', 0)
         max_memory = info.get('maxmemory', 0)
-        max_memory_mb = max_memory / (1024 * 1024) if max_memory > 0 else None
         
-        return {
-            'used_memory_mb': round(used_memory_mb, 2),
-            'used_memory_human': info.get('used_memory_human', 'N/A'),
-            'maxmemory_mb': round(max_memory_mb, 2) if max_memory_mb else 'Not set',
-            'fragmentation_ratio': round(info.get('mem_fragmentation_ratio', 0), 2),
-            'evicted_keys': info.get('evicted_keys', 0)
-        }
+        return MemoryInfo(
+            used_memory=used_memory,
+            used_memory_human=info.get('used_memory_human') or _human(used_memory),
+            maxmemory=max_memory,
+            maxmemory_human=_human(max_memory) if max_memory > 0 else 'Not set',
+            fragmentation_ratio=round(info.get('mem_fragmentation_ratio', 0), 2),
+            evicted_keys=info.get('evicted_keys', 0)
+        )
 
-    def get_stats(self):
+    def get_stats(self, info=None):
         """Get performance statistics"""
-        info = self.redis.info('stats')
-        return {
-            'total_connections': info.get('total_connections_received', 0),
-            'total_commands': info.get('total_commands_processed', 0),
-            'ops_per_sec': info.get('instantaneous_ops_per_sec', 0),
-            'rejected_connections': info.get('rejected_connections', 0),
-            'keyspace_hits': info.get('keyspace_hits', 0),
-            'keyspace_misses': info.get('keyspace_misses', 0)
-        }
+        if info is None:
+            info = self.redis.info('stats')
+        return Stats(
+            total_connections=info.get('total_connections_received', 0),
+            total_commands=info.get('total_commands_processed', 0),
+            ops_per_sec=info.get('instantaneous_ops_per_sec', 0),
+            rejected_connections=info.get('rejected_connections', 0),
+            keyspace_hits=info.get('keyspace_hits', 0),
+            keyspace_misses=info.get('keyspace_misses', 0)
+        )
 
     def get_hit_rate(self, stats):
         """Calculate cache hit rate"""
-        hits = stats['keyspace_hits']
-        misses = stats['keyspace_misses']
+        hits = stats.keyspace_hits
+        misses = stats.keyspace_misses
         total = hits + misses
         
         if total == 0:
@@ -81,185 +313,555 @@ class RedisHealthMonitor:
         
         return round((hits / total) * 100, 2)
 
-    def get_clients_info(self):
+    def get_clients_info(self, info=None):
         """Get connected clients information"""
-        info = self.redis.info('clients')
-        return {
-            'connected_clients': info.get('connected_clients', 0),
-            'blocked_clients': info.get('blocked_clients', 0),
-            'max_clients': info.get('maxclients', 10000)
-        }
+        if info is None:
+            info = self.redis.info('clients')
+        return ClientsInfo(
+            connected_clients=info.get('connected_clients', 0),
+            blocked_clients=info.get('blocked_clients', 0),
+            max_clients=info.get('maxclients', 10000)
+        )
 
-    def get_replication_info(self):
+    def get_replication_info(self, info=None):
         """Get replication status"""
-        info = self.redis.info('replication')
+        if info is None:
+            info = self.redis.info('replication')
+        elif 'role' not in info:
+            # Section was skipped for a standalone master, see _queue_snapshot
+            return ReplicationInfo(role=self._role)
         role = info.get('role', 'unknown')
         
-        result = {'role': role}
-        
         if role == 'master':
-            result['connected_slaves'] = info.get('connected_slaves', 0)
+            return ReplicationInfo(role=role, connected_slaves=info.get('connected_slaves', 0))
         elif role == 'slave':
-            result['master_link_status'] = info.get('master_link_status', 'unknown')
-            result['master_host'] = info.get('master_host', 'unknown')
+            return ReplicationInfo(
+                role=role,
+                master_link_status=info.get('master_link_status', 'unknown'),
+                master_host=info.get('master_host', 'unknown')
+            )
         
-        return result
+        return ReplicationInfo(role=role)
 
-    def get_slow_log(self, count=5):
-        """Get recent slow queries"""
-        try:
-            slow_log = self.redis.slowlog_get(count)
-            return slow_log
-        except Exception as e:
-            return []
+    def get_snapshot(self, slow_count=5):
+        """Fetch the INFO sections we display and the slow log in a single round-trip"""
+        pipe = self._queue_snapshot(self.redis.pipeline(transaction=False), slow_count)
+        return self._merge_snapshot(pipe.execute(raise_on_error=False))
+
+    async def get_snapshot_async(self, client, slow_count=5):
+        """Same as get_snapshot(), over an asyncio Redis client"""
+        pipe = self._queue_snapshot(client.pipeline(transaction=False), slow_count)
+        return self._merge_snapshot(await pipe.execute(raise_on_error=False))
+
+    def _queue_snapshot(self, pipe, slow_count):
+        """Queue the snapshot commands on a pipeline"""
+        self._refreshes += 1
+        recheck = self._refreshes % _TOPOLOGY_RECHECK == 0
+        skip = set()
+        if not self._probe_server and not recheck:
+            skip.add('server')
+        if self._skip_repl and not recheck:
+            skip.add('replication')
+        for section in _INFO_SECTIONS:
+            if section in skip:
+                continue
+            pipe.info(section)
+        pipe.slowlog_get(slow_count)
+        return pipe
 
-    def get_persistence_info(self):
+    def _merge_snapshot(self, results):
+        """Merge snapshot pipeline replies into (info, slow_log)"""
+        *sections, slow_log = results
+        info = {}
+        for section in sections:
+            if isinstance(section, Exception):
+                raise section
+            info.update(section)
+        if 'role' in info:
+            self._update_topology(info)
+        # Counters going backwards means the server restarted: re-read the
+        # server section on the next refresh instead of trusting the cache
+        connections = info.get('total_connections_received', 0)
+        if connections < self._last_connections:
+            self._probe_server = True
+        self._last_connections = connections
+        # SLOWLOG may be disabled (e.g. managed Redis); treat as empty
+        if isinstance(slow_log, Exception):
+            slow_log = []
+        return info, slow_log
+
+    def get_persistence_info(self, info=None):
         """Get persistence configuration"""
-        info = self.redis.info('persistence')
-        return {
-            'rdb_enabled': info.get('rdb_bgsave_in_progress', 0) == 0,
-            'rdb_last_save': info.get('rdb_last_save_time', 0),
-            'aof_enabled': info.get('aof_enabled', 0) == 1,
-            'aof_rewrite_in_progress': info.get('aof_rewrite_in_progress', 0) == 1
-        }
+        if info is None:
+            info = self.redis.info('persistence')
+        return PersistenceInfo(
+            rdb_enabled=info.get('rdb_bgsave_in_progress', 0) == 0,
+            rdb_last_save=info.get('rdb_last_save_time', 0),
+            aof_enabled=info.get('aof_enabled', 0) == 1,
+            aof_rewrite_in_progress=info.get('aof_rewrite_in_progress', 0) == 1
+        )
+
+    def parse_snapshot(self, info):
+        """Parse one INFO reply into every section the dashboard uses"""
+        stats = self.get_stats(info)
+        return Snapshot(
+            server=self.get_server_info(info),
+            memory=self.get_memory_info(info),
+            stats=stats,
+            hit_rate=self.get_hit_rate(stats),
+            clients=self.get_clients_info(info),
+            replication=self.get_replication_info(info),
+            persistence=self.get_persistence_info(info),
+            timestamp=time.time()
+        )
 
-    def check_health(self):
+    def record(self, info):
+        """Parse an INFO reply and keep the snapshot in the history"""
+        snap = self.parse_snapshot(info)
+        self._history.append(snap)
+        return snap
+
+    def check_health(self, snapshot=None):
         """Perform health checks and return warnings"""
-        warnings = []
-        
-        # Check memory
-        memory = self.get_memory_info()
-        if memory['fragmentation_ratio'] > 1.5:
-            warnings.append(f"⚠️  High memory fragmentation: {memory['fragmentation_ratio']}")
-        
-        if memory['evicted_keys'] > 0:
-            warnings.append(f"⚠️  Keys being evicted: {memory['evicted_keys']}")
-        
-        # Check clients
-        clients = self.get_clients_info()
-        client_usage = (clients['connected_clients'] / clients['max_clients']) * 100
-        if client_usage > 80:
-            warnings.append(f"⚠️  High client usage: {client_usage:.1f}%")
-        
-        # Check hit rate
-        stats = self.get_stats()
-        hit_rate = self.get_hit_rate(stats)
-        if hit_rate < 80 and (stats['keyspace_hits'] + stats['keyspace_misses']) > 100:
-            warnings.append(f"⚠️  Low cache hit rate: {hit_rate}%")
-        
-        # Check replication
-        repl = self.get_replication_info()
-        if repl['role'] == 'slave' and repl.get('master_link_status') != 'up':
-            warnings.append(f"❌ Replication link DOWN!")
-        
-        return warnings
+        if snapshot is None:
+            snapshot = self.parse_snapshot(self.redis.info())
+        return [template.format(s=snapshot) for check, template in _CHECKS if check(snapshot)]
 
     def display_dashboard(self):
         """Display formatted health dashboard"""
-        # Clear screen (works on Unix/Linux/Mac)
-        print("\033[H\033[J", end="")
-        
-        print("=" * 70)
-        print("           🔴 REDIS HEALTH MONITOR")
-        print("           Built by Valters Upenieks for Redis Interview")
-        print("=" * 70)
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-        # Server Info
-        server = self.get_server_info()
-        print("📊 SERVER INFORMATION")
-        print(f"   Redis Version: {server['version']}")
-        print(f"   OS: {server['os']}")
-        print(f"   Uptime: {server['uptime_days']} days ({server['uptime_seconds']} seconds)")
-        print()
-
-        # Memory Info
-        memory = self.get_memory_info()
-        print("💾 MEMORY USAGE")
-        print(f"   Used Memory: {memory['used_memory_human']} ({memory['used_memory_mb']} MB)")
-        print(f"   Max Memory: {memory['maxmemory_mb']}")
-        print(f"   Fragmentation Ratio: {memory['fragmentation_ratio']}")
-        print(f"   Evicted Keys: {memory['evicted_keys']}")
-        print()
-
-        # Stats
-        stats = self.get_stats()
-        hit_rate = self.get_hit_rate(stats)
-        print("⚡ PERFORMANCE STATS")
-        print(f"   Operations/sec: {stats['ops_per_sec']}")
-        print(f"   Total Commands: {stats['total_commands']:,}")
-        print(f"   Total Connections: {stats['total_connections']:,}")
-        print(f"   Cache Hit Rate: {hit_rate}%")
-        print(f"   Rejected Connections: {stats['rejected_connections']}")
-        print()
-
-        # Clients
-        clients = self.get_clients_info()
-        print("👥 CONNECTED CLIENTS")
-        print(f"   Connected: {clients['connected_clients']}")
-        print(f"   Blocked: {clients['blocked_clients']}")
-        print(f"   Max Clients: {clients['max_clients']}")
-        print()
+        # Fetch INFO sections and SLOWLOG in one round-trip
+        info, slow_queries = self.get_snapshot(5)
+        self._paint(self.render_dashboard(info, slow_queries))
+
+    def render_dashboard(self, info, slow_queries):
+        """Build the dashboard lines for one snapshot"""
+        snap = self.record(info)
+        timestamp = time.strftime(_TIME_FORMAT, time.localtime(snap.timestamp))
+        lines = [template.format(snap=snap, timestamp=timestamp) for template in _DASHBOARD_SPEC]
 
         # Replication
-        repl = self.get_replication_info()
-        print("🔄 REPLICATION")
-        print(f"   Role: {repl['role'].upper()}")
-        if repl['role'] == 'master':
-            print(f"   Connected Slaves: {repl.get('connected_slaves', 0)}")
-        elif repl['role'] == 'slave':
-            print(f"   Master: {repl.get('master_host', 'N/A')}")
-            print(f"   Link Status: {repl.get('master_link_status', 'N/A')}")
-        print()
+        repl = snap.replication
+        lines.append("🔄 REPLICATION")
+        lines.append(f"   Role: {repl.role.upper()}")
+        if repl.role == 'master':
+            lines.append(f"   Connected Slaves: {repl.connected_slaves}")
+        elif repl.role == 'slave':
+            lines.append(f"   Master: {repl.master_host}")
+            lines.append(f"   Link Status: {repl.master_link_status}")
+        lines.append("")
 
         # Persistence
-        persist = self.get_persistence_info()
-        print("💿 PERSISTENCE")
-        print(f"   RDB Enabled: {'Yes' if persist['rdb_enabled'] else 'No'}")
-        if persist['rdb_last_save'] > 0:
-            last_save = datetime.fromtimestamp(persist['rdb_last_save'])
-            print(f"   Last RDB Save: {last_save.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"   AOF Enabled: {'Yes' if persist['aof_enabled'] else 'No'}")
-        print()
+        persist = snap.persistence
+        lines.append("💿 PERSISTENCE")
+        lines.append(f"   RDB Enabled: {'Yes' if persist.rdb_enabled else 'No'}")
+        if persist.rdb_last_save > 0:
+            lines.append(f"   Last RDB Save: {self._format_last_save(persist.rdb_last_save)}")
+        lines.append(f"   AOF Enabled: {'Yes' if persist.aof_enabled else 'No'}")
+        lines.append("")
 
         # Slow Log
-        slow_queries = self.get_slow_log(5)
         if slow_queries:
-            print("🐌 RECENT SLOW QUERIES (>10ms)")
+            lines.append("🐌 RECENT SLOW QUERIES (>10ms)")
             for i, query in enumerate(slow_queries[:5], 1):
                 duration_ms = query['duration'] / 1000  # Convert to milliseconds
-                command = ' '.join(str(arg) for arg in query['command'])
-                print(f"   {i}. {duration_ms:.2f}ms - {command[:60]}")
-            print()
+                # redis-py returns the joined arguments as raw bytes even with
+                # decode_responses, and they may not be valid UTF-8
+                command = query['command']
+                if isinstance(command, bytes):
+                    command = command.decode('utf-8', 'replace')
+                lines.append(f"   {i}. {duration_ms:.2f}ms - {command[:60]}")
+            lines.append("")
 
         # Health Warnings
-        warnings = self.check_health()
+        warnings = self.check_health(snap)
+        if warnings:
+            lines.append("⚠️  HEALTH WARNINGS")
+            for warning in warnings:
+                lines.append(f"   {warning}")
+            lines.append("")
+        else:
+            lines.append("✅ ALL HEALTH CHECKS PASSED")
+            lines.append("")
+
+        lines.extend(_DASHBOARD_FOOTER)
+        return lines
+
+    def _format_last_save(self, ts):
+        """Format rdb_last_save_time, reusing the string until the next save"""
+        if ts != self._last_save_str_cache[0]:
+            self._last_save_str_cache = (ts, time.strftime(_TIME_FORMAT, time.localtime(ts)))
+        return self._last_save_str_cache[1]
+
+    def render_error(self, error):
+        """Build the dashboard shown while INFO cannot be fetched"""
+        lines = [template.format(timestamp=time.strftime(_TIME_FORMAT)) for template in _DASHBOARD_SPEC[:6]]
+        lines.append(f"❌ Cannot fetch INFO from {self.address}: {error}")
+        lines.append("   Retrying every refresh...")
+        lines.append("")
+        lines.extend(_DASHBOARD_FOOTER)
+        return lines
+
+    def _paint(self, lines):
+        """Repaint only the dashboard rows that changed since the last refresh"""
+        self._lines = lines
+        self._frame = _paint_frame(self._frame, lines)
+
+    def _force_repaint(self):
+        """Clear and redraw the last dashboard at the new size (on SIGWINCH)"""
+        if self._lines:
+            self._frame = _paint_frame([], self._lines)
+
+    def open_async(self):
+        """Create an asyncio client with this monitor's connection settings"""
+        self.async_pool = aredis.ConnectionPool(**self._connection_kwargs)
+        # From here on only the async client talks to Redis; drop the idle
+        # sync connection so the monitor holds one connection per host
+        self.pool.disconnect()
+        return aredis.Redis(connection_pool=self.async_pool)
+
+    def render_panel(self, info, slow_queries):
+        """Build the compact per-host panel used by the multi-host dashboard"""
+        snap = self.record(info)
+        server = snap.server
+        memory = snap.memory
+        stats = snap.stats
+        clients = snap.clients
+        lines = [
+            f"🔴 {self.address}  |  Redis {server.version}  |  {snap.replication.role.upper()}  |  Up {server.uptime_days} days",
+            f"   Memory: {memory.used_memory_human} (frag {memory.fragmentation_ratio})  |  Ops/sec: {stats.ops_per_sec}  |  Hit Rate: {snap.hit_rate}%",
+            f"   Clients: {clients.connected_clients}/{clients.max_clients}  |  Blocked: {clients.blocked_clients}  |  Slow Queries: {len(slow_queries)}"
+        ]
+        warnings = self.check_health(snap)
         if warnings:
-            print("⚠️  HEALTH WARNINGS")
             for warning in warnings:
-                print(f"   {warning}")
-            print()
+                lines.append(f"   {warning}")
         else:
-            print("✅ ALL HEALTH CHECKS PASSED")
-            print()
+            lines.append("   ✅ All health checks passed")
+        lines.append("")
+        return lines
+
+    async def monitor_continuous_async(self, interval=5, exporter=None):
+        """Continuously monitor Redis on a fixed cadence using asyncio
 
-        print("=" * 70)
-        print("Press Ctrl+C to exit | Refreshes every 5 seconds")
-        print("=" * 70)
+        With a PrometheusExporter, each refresh updates its gauges instead
+        of repainting the terminal.
+        """
+        client = self.open_async()
+        # Bind once; the loop body runs for the lifetime of the process
+        fetch = self.get_snapshot_async
+        render = self.render_dashboard
+        paint = self._paint
 
-    def monitor_continuous(self, interval=5):
-        """Continuously monitor Redis"""
+        if exporter is None:
+            async def refresh():
+                try:
+                    snapshot = await fetch(client, 5)
+                except (redis.RedisError, OSError) as e:
+                    # Keep the loop (and the history for --dump) alive; the
+                    # pool reconnects on the next tick
+                    paint(self.render_error(e))
+                    return
+                paint(render(*snapshot))
+        else:
+            async def refresh():
+                try:
+                    info, _ = await fetch(client, 5)
+                except (redis.RedisError, OSError):
+                    # Keep serving /metrics; the pool reconnects on the next tick
+                    exporter.mark_down(self.address)
+                    return
+                exporter.update(self.address, self.record(info))
+
+        try:
+            await _run_on_cadence(refresh, interval, self._force_repaint)
+        finally:
+            await self.async_pool.disconnect()
+
+    def dump_history(self, path):
+        """Write the recorded snapshots to a gzipped JSONL file"""
+        return _write_history(path, [self])
+
+    def monitor_continuous(self, interval=5, dump_path=None, exporter=None):
+        """Continuously monitor Redis until Ctrl+C or SIGTERM"""
         try:
-            while True:
-                self.display_dashboard()
-                time.sleep(interval)
+            asyncio.run(self.monitor_continuous_async(interval, exporter))
         except KeyboardInterrupt:
+            pass
+        finally:
+            # Runs on a crash too, so --dump still saves what led up to it
+            self.close()
             print("\n\n👋 Monitoring stopped. Goodbye!")
-            sys.exit(0)
+            if dump_path:
+                _report_dump(dump_path, self.dump_history(dump_path))
+        sys.exit(0)
 
-    def run_once(self):
+    def run_once(self, dump_path=None):
         """Run monitor once (non-continuous)"""
         self.display_dashboard()
+        self.close()
+        if dump_path:
+            _report_dump(dump_path, self.dump_history(dump_path))
+
+class MultiHostMonitor:
+    """Monitor several Redis hosts from one process, fetching them concurrently"""
+
+    def __init__(self, monitors):
+        self.monitors = monitors
+        self._frame = []
+        self._lines = []
+
+    def close(self):
+        """Close every host's Redis connection"""
+        for monitor in self.monitors:
+            monitor.close()
+
+    def _paint(self, lines):
+        """Repaint only the dashboard rows that changed since the last refresh"""
+        self._lines = lines
+        self._frame = _paint_frame(self._frame, lines)
+
+    def _force_repaint(self):
+        """Clear and redraw the last dashboard at the new size (on SIGWINCH)"""
+        if self._lines:
+            self._frame = _paint_frame([], self._lines)
+
+    async def get_snapshots_async(self, clients):
+        """Fetch every host's snapshot in parallel; failures are returned, not raised"""
+        return await asyncio.gather(
+            *(monitor.get_snapshot_async(client, 5) for monitor, client in zip(self.monitors, clients)),
+            return_exceptions=True
+        )
+
+    def render_dashboard(self, results):
+        """Build the dashboard lines with one panel per host"""
+        timestamp = time.strftime(_TIME_FORMAT)
+        lines = [template.format(timestamp=timestamp) for template in _DASHBOARD_SPEC[:6]]
+        for monitor, result in zip(self.monitors, results):
+            if isinstance(result, Exception):
+                lines.append(f"🔴 {monitor.address}")
+                lines.append(f"   ❌ Cannot fetch INFO: {result}")
+                lines.append("")
+            else:
+                lines.extend(monitor.render_panel(*result))
+        lines.extend(_DASHBOARD_FOOTER)
+        return lines
+
+    async def _monitor_async(self, interval=None, exporter=None):
+        """Refresh all hosts on a fixed cadence, or once if interval is None"""
+        clients = [monitor.open_async() for monitor in self.monitors]
+        fetch = self.get_snapshots_async
+        render = self.render_dashboard
+        paint = self._paint
+
+        if exporter is None:
+            async def refresh():
+                paint(render(await fetch(clients)))
+        else:
+            async def refresh():
+                for monitor, result in zip(self.monitors, await fetch(clients)):
+                    if isinstance(result, Exception):
+                        exporter.mark_down(monitor.address)
+                    else:
+                        exporter.update(monitor.address, monitor.record(result[0]))
+
+        try:
+            if interval is None:
+                await refresh()
+            else:
+                await _run_on_cadence(refresh, interval, self._force_repaint)
+        finally:
+            for monitor in self.monitors:
+                await monitor.async_pool.disconnect()
+
+    def dump_history(self, path):
+        """Write every host's recorded snapshots to one gzipped JSONL file"""
+        return _write_history(path, self.monitors)
+
+    def monitor_continuous(self, interval=5, dump_path=None, exporter=None):
+        """Continuously monitor all hosts until Ctrl+C or SIGTERM"""
+        try:
+            asyncio.run(self._monitor_async(interval, exporter))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            # Runs on a crash too, so --dump still saves what led up to it
+            self.close()
+            print("\n\n👋 Monitoring stopped. Goodbye!")
+            if dump_path:
+                _report_dump(dump_path, self.dump_history(dump_path))
+        sys.exit(0)
+
+    def run_once(self, dump_path=None):
+        """Run monitor once (non-continuous)"""
+        asyncio.run(self._monitor_async())
+        self.close()
+        if dump_path:
+            _report_dump(dump_path, self.dump_history(dump_path))
+
+class PrometheusExporter:
+    """Serve parsed snapshots as Prometheus gauges, labelled by instance"""
+
+    def __init__(self, port):
+        try:
+            from prometheus_client import Gauge, start_http_server
+        except ImportError:
+            print("❌ --prom-port needs prometheus_client")
+            print("   Install it with: pip install prometheus_client")
+            sys.exit(1)
+        self._up = Gauge('redis_up', 'Whether the last INFO fetch succeeded', ['instance'])
+        self._gauges = [
+            (Gauge(name, doc, ['instance']), value)
+            for name, doc, value in _PROM_METRICS
+        ]
+        start_http_server(port)
+        print(f"📡 Serving Prometheus metrics on port {port} (/metrics)")
+
+    def update(self, address, snap):
+        """Set every gauge for one host from its latest snapshot"""
+        self._up.labels(instance=address).set(1)
+        for gauge, value in self._gauges:
+            gauge.labels(instance=address).set(value(snap))
+
+    def mark_down(self, address):
+        """Flag a host whose fetch failed; its other gauges keep their last values"""
+        self._up.labels(instance=address).set(0)
+
+def _paint_frame(previous, lines):
+    """Repaint the rows of lines that differ from previous; returns the new frame"""
+    if not sys.stdout.isatty():
+        # Pipe or file: cursor codes are noise, emit the whole frame in one write
+        _write_out("\n".join(lines) + "\n")
+        return lines
+
+    columns, rows = shutil.get_terminal_size()
+    # Clip so no line wraps; a wrapped line would shift every row below it
+    lines = [_clip(line, columns - 1) for line in lines]
+    if len(lines) >= rows:
+        # Taller than the screen: absolute row moves would clamp onto the
+        # last line, so clear and print sequentially and let it scroll
+        _write_out("\033[H\033[J" + "\n".join(lines) + "\n")
+        return []
+
+    out = []
+    if not previous:
+        # First paint: clear screen (works on Unix/Linux/Mac)
+        out.append("\033[H\033[J")
+    for row, line in enumerate(lines, 1):
+        if row > len(previous) or previous[row - 1] != line:
+            out.append(f"\033[{row};1H{line}\033[K")
+    if len(lines) < len(previous):
+        # Dashboard got shorter (e.g. warnings cleared): erase the rest
+        out.append(f"\033[{len(lines) + 1};1H\033[J")
+    # Park the cursor below the dashboard
+    out.append(f"\033[{len(lines) + 1};1H")
+    _write_out("".join(out))
+    return lines
+
+def _clip(line, width):
+    """Cut line to at most width terminal columns (wide emoji count as two)"""
+    used = 0
+    for i, char in enumerate(line):
+        if unicodedata.combining(char) or char == '\ufe0f':
+            continue
+        used += 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+        if used > width:
+            return line[:i]
+    return line
+
+def _write_out(text):
+    """Write text straight to the stdout file descriptor, bypassing TextIOWrapper"""
+    # Flush first so anything print()ed earlier still comes out in order
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # stdout replaced by an in-memory stream
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    data = memoryview(text.encode('utf-8'))
+    while data:
+        data = data[os.write(fd, data):]
+
+async def _run_on_cadence(refresh, interval, on_resize=None):
+    """Await refresh() every interval seconds until SIGTERM or cancellation"""
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    handled = _add_signal_handlers(loop, stop, on_resize)
+    wait_for = asyncio.wait_for
+    try:
+        deadline = loop.time()
+        while not stop.is_set():
+            await refresh()
+            # Sleep to the next tick rather than a full interval, so the
+            # fetch round-trip does not stretch the refresh period
+            deadline = max(deadline + interval, loop.time())
+            try:
+                await wait_for(stop.wait(), max(0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        for signum in handled:
+            loop.remove_signal_handler(signum)
+
+def _add_signal_handlers(loop, stop, on_resize):
+    """Stop on SIGTERM (e.g. container shutdown) and call on_resize on SIGWINCH"""
+    handlers = {signal.SIGTERM: stop.set}
+    if on_resize is not None and hasattr(signal, 'SIGWINCH'):
+        handlers[signal.SIGWINCH] = on_resize
+    handled = []
+    for signum, handler in handlers.items():
+        try:
+            loop.add_signal_handler(signum, handler)
+        except NotImplementedError:
+            # Event loops on Windows have no signal handler support
+            break
+        handled.append(signum)
+    return handled
+
+def _write_history(path, monitors):
+    """Dump each monitor's snapshot history as gzipped JSONL; returns the record count"""
+    count = 0
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for monitor in monitors:
+            for snap in monitor._history:
+                record = asdict(snap)
+                record['host'] = monitor.address
+                f.write(json.dumps(record) + "\n")
+                count += 1
+    return count
+
+def _report_dump(path, count):
+    """Tell the user where the history went"""
+    print(f"💾 Saved {count} snapshots to {path}")
+
+def _parse_hosts(hosts, default_port):
+    """Parse 'host1,host2:6380,[::1]:6381' into [(host, port), ...]; raises ValueError"""
+    addresses = []
+    for entry in hosts.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        if entry.startswith('['):
+            # Bracketed IPv6 literal: [::1] or [::1]:6380
+            host, sep, port = entry[1:].partition(']')
+            if not sep or (port and not port.startswith(':')):
+                raise ValueError(f"malformed IPv6 address in {entry!r}")
+            port = port[1:]
+        else:
+            host, sep, port = entry.rpartition(':')
+            if not sep:
+                host, port = entry, ''
+            if ':' in host:
+                raise ValueError(f"IPv6 addresses must be bracketed, e.g. [::1]:6379, in {entry!r}")
+        if not host:
+            raise ValueError(f"missing host in {entry!r}")
+        if port and not (port.isdigit() and 0 < int(port) < 65536):
+            raise ValueError(f"invalid port in {entry!r}")
+        addresses.append((host, int(port) if port else default_port))
+    if not addresses:
+        raise ValueError("no hosts given")
+    return addresses
 
 def main():
     """Main entry point"""
@@ -268,19 +870,39 @@ def main():
     parser = argparse.ArgumentParser(description='Redis Health Monitor')
     parser.add_argument('--host', default='localhost', help='Redis host (default: localhost)')
     parser.add_argument('--port', type=int, default=6379, help='Redis port (default: 6379)')
+    parser.add_argument('--hosts', help='Comma-separated host[:port] list to monitor together, IPv6 as [addr]:port (overrides --host)')
     parser.add_argument('--once', action='store_true', help='Run once instead of continuous')
     parser.add_argument('--interval', type=int, default=5, help='Refresh interval in seconds (default: 5)')
+    parser.add_argument('--prom-port', type=int, metavar='PORT',
+                        help='Serve Prometheus metrics on PORT instead of drawing the dashboard (e.g. 9121)')
+    parser.add_argument('--dump', metavar='PATH', help='On exit, write the last hour of snapshots to PATH (gzipped JSONL)')
     
     args = parser.parse_args()
+    if args.once and args.prom_port:
+        parser.error('--prom-port serves metrics continuously and cannot be combined with --once')
     
+    if args.hosts:
+        try:
+            addresses = _parse_hosts(args.hosts, args.port)
+        except ValueError as e:
+            parser.error(f"--hosts: {e}")
+
     # Create monitor
-    monitor = RedisHealthMonitor(host=args.host, port=args.port)
+    if args.hosts:
+        # A host that is down at launch shows as down instead of stopping the rest
+        monitor = MultiHostMonitor([
+            RedisHealthMonitor(host=host, port=port, exit_on_error=False)
+            for host, port in addresses
+        ])
+    else:
+        monitor = RedisHealthMonitor(host=args.host, port=args.port)
     
     # Run
     if args.once:
-        monitor.run_once()
+        monitor.run_once(dump_path=args.dump)
     else:
-        monitor.monitor_continuous(interval=args.interval)
+        exporter = PrometheusExporter(args.prom_port) if args.prom_port else None
+        monitor.monitor_continuous(interval=args.interval, dump_path=args.dump, exporter=exporter)
 
 if __name__ == '__main__':
     main()